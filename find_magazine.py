@@ -20,8 +20,9 @@ import sqlite3
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 from dotenv import load_dotenv
 from langdetect import DetectorFactory, detect
 from telethon import TelegramClient
@@ -29,6 +30,7 @@ from telethon.tl.types import DocumentAttributeFilename, Message
 
 from openai_compat import OpenAICompatConfigError, load_openai_compat
 from telegram_links import message_deep_link
+from telegram_session import run_event_loop, tune_session_db
 
 
 async def retry_with_backoff(func, *args, max_retries=5, initial_delay=1, **kwargs):
@@ -73,15 +75,35 @@ if sys.platform == "win32":
 # Constants
 SESSION_NAME = "toi_session"
 OUTPUT_DIR = Path("outputs")
-CACHE_DIR = Path(".cache/magazine_search")
+CACHE_DB = Path(".cache/magazine_search.db")
+# SQLite caps bound parameters per statement; look keys up in chunks.
+CACHE_LOOKUP_CHUNK = 500
 MAX_LLM_RETRIES = 5
 DEFAULT_BATCH_DELAY = 40
 # Local models typically have 4k–16k context; reserved max_tokens counts against it.
 DEFAULT_BATCH_SIZE = 50
+# AI batches in flight at once. 1 keeps the historical one request per
+# batch_delay; raise it only for servers that allow the higher request rate.
+DEFAULT_BATCH_CONCURRENCY = 1
 DEFAULT_MAX_AGE_DAYS = 90  # ~3 months; skip older channel posts
-TOKENS_PER_DECISION = 48
+# Completion tokens per item. A decision with confidence and MAX_TOPICS topics
+# is ~40 tokens; this leaves headroom while a DEFAULT_BATCH_SIZE batch still
+# stays under MAX_COMPLETION_TOKENS_CAP.
+TOKENS_PER_DECISION = 56
 MAX_COMPLETION_TOKENS_CAP = 4096
 CAPTION_PROMPT_CHARS = 80
+MAX_TOPICS = 3
+# Channels scanned concurrently; each is independent Telegram network work.
+CHANNEL_SCAN_CONCURRENCY = 8
+# Scanned candidates waiting for evaluation; a full queue pauses scanning.
+PIPELINE_QUEUE_SIZE = 200
+VALID_EXTS = (".pdf", ".epub", ".mobi", ".zip", ".rar")
+# Installer/app uploads mark a software channel; only the newest posts are probed.
+JUNK_EXTS = (".apk", ".exe", ".dmg", ".ipa")
+JUNK_PROBE_MESSAGES = 20
+ENGLISH_ASCII_RATIO = 0.85
+LANGDETECT_MIN_CAPTION_CHARS = 200
+_NON_ASCII_BYTES = bytes(range(128, 256))
 
 
 def message_cutoff(max_age_days: int, *, now: Optional[datetime] = None) -> datetime:
@@ -136,6 +158,58 @@ def _is_context_overflow_error(err: BaseException) -> bool:
     return any(n in err_str for n in needles)
 
 
+def open_decision_cache(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the single-file AI decision cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "CREATE TABLE IF NOT EXISTS c (k BLOB PRIMARY KEY, v BLOB NOT NULL);"
+        "CREATE TABLE IF NOT EXISTS t (k BLOB PRIMARY KEY, v BLOB NOT NULL);"
+    )
+    return conn
+
+
+def cache_get_many(
+    conn: sqlite3.Connection, keys: Iterable[bytes], table: str = "c"
+) -> Dict[bytes, Dict[str, Any]]:
+    """Fetch cached entries for the given keys; missing keys are omitted.
+
+    Table "c" holds per-keyword decisions, "t" keyword-independent topics.
+    """
+    unique = list(dict.fromkeys(keys))
+    found: Dict[bytes, Dict[str, Any]] = {}
+    for i in range(0, len(unique), CACHE_LOOKUP_CHUNK):
+        chunk = unique[i : i + CACHE_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        for k, v in conn.execute(
+            f"SELECT k, v FROM {table} WHERE k IN ({placeholders})", chunk
+        ):
+            found[bytes(k)] = orjson.loads(v)
+    return found
+
+
+def cache_put_many(
+    conn: sqlite3.Connection,
+    items: Iterable[Tuple[bytes, Dict[str, Any]]],
+    table: str = "c",
+) -> None:
+    """Store entries in one transaction."""
+    with conn:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table} (k, v) VALUES (?, ?)",
+            ((k, orjson.dumps(v)) for k, v in items),
+        )
+
+
+def topics_cover_keywords(topics: Iterable[str], kw_tokens: Iterable[str]) -> bool:
+    """True when every keyword token is one of the topic words."""
+    words = {w for t in topics for w in re.split(r"\W+", t.lower()) if w}
+    tokens = list(kw_tokens)
+    return bool(words and tokens) and all(t in words for t in tokens)
+
+
 class MagazineSearcher:
     def __init__(
         self,
@@ -144,6 +218,7 @@ class MagazineSearcher:
         *,
         batch_size: int = DEFAULT_BATCH_SIZE,
         batch_delay: float = DEFAULT_BATCH_DELAY,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
         keyword_only: bool = False,
         cache_enabled: bool = True,
         openai_client=None,
@@ -153,9 +228,11 @@ class MagazineSearcher:
         self.api_hash = api_hash
         self.batch_size = batch_size
         self.batch_delay = batch_delay
+        self.batch_concurrency = batch_concurrency
         self.keyword_only = keyword_only
         self.cache_enabled = cache_enabled
         self.client = TelegramClient(SESSION_NAME, api_id, api_hash)
+        tune_session_db(self.client)
 
         self.openai_client = openai_client
         self.openai_model = openai_model
@@ -166,21 +243,107 @@ class MagazineSearcher:
             self.openai_model = compat.model
 
         OUTPUT_DIR.mkdir(exist_ok=True)
-        if cache_enabled:
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._cache_db = open_decision_cache(CACHE_DB) if cache_enabled else None
 
     async def start(self):
         await retry_with_backoff(self.client.start)
         logger.info("Telegram client started.")
 
     async def stop(self):
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
         await self.client.disconnect()
         logger.info("Telegram client disconnected.")
 
-    async def scan_channels(
-        self, limit: int = 500, max_age_days: int = DEFAULT_MAX_AGE_DAYS
+    async def scan_and_evaluate(
+        self,
+        user_keywords: str,
+        limit: int = 500,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
     ) -> List[Dict[str, Any]]:
-        candidates = []
+        """Scan channels and evaluate candidates as a producer/consumer pipeline.
+
+        Candidates are queued as each channel finishes and evaluated in
+        batch_size groups while the remaining channels are still scanning,
+        so total time approaches max(scan, eval) rather than scan + eval.
+
+        Files are deduplicated by (filename, size). The first copy scanned is
+        the one evaluated, so its caption feeds the prompt and keyword-only
+        matching; the newest copy is the one reported. Results are RELEVANT
+        candidates sorted newest first.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+        async def _enqueue(found: List[Dict[str, Any]]) -> None:
+            for c in found:
+                await queue.put(c)
+
+        async def _produce() -> None:
+            try:
+                await self._scan_all(limit, max_age_days, _enqueue)
+            finally:
+                await queue.put(None)
+
+        # Shared by every batch so model requests are bounded and paced across
+        # the whole run; batches answered without a request don't wait.
+        llm_slots = self._llm_slots()
+
+        async def _evaluate(batch: List[Dict[str, Any]]) -> None:
+            await self.evaluate_candidates(
+                batch, user_keywords, llm_slots=llm_slots, log_matches=False
+            )
+
+        # First candidate per (filename, size) is evaluated; the newest copy
+        # is the one reported, so [MATCH] lines are logged once it is known.
+        evaluated: Dict[Any, Dict[str, Any]] = {}
+        newest: Dict[Any, Dict[str, Any]] = {}
+        pending: List[Dict[str, Any]] = []
+        tasks = []
+        producer = asyncio.create_task(_produce())
+        try:
+            while (c := await queue.get()) is not None:
+                key = (c["filename"], c["size"])
+                if key not in evaluated:
+                    evaluated[key] = newest[key] = c
+                    pending.append(c)
+                    if len(pending) >= self.batch_size:
+                        tasks.append(asyncio.create_task(_evaluate(pending)))
+                        pending = []
+                elif c["date"] > newest[key]["date"]:
+                    newest[key] = c
+            if pending:
+                tasks.append(asyncio.create_task(_evaluate(pending)))
+            await producer
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (producer, *tasks):
+                task.cancel()
+
+        logger.info(f"Found {len(evaluated)} unique candidates.")
+        results = []
+        for key, c in evaluated.items():
+            decision = c.get("ai_decision") or {}
+            if decision.get("decision") != "RELEVANT":
+                continue
+            latest = newest[key]
+            latest["ai_decision"] = decision
+            results.append(latest)
+        # Channel scans finish in any order; sort so saved output is stable.
+        results.sort(
+            key=lambda c: (c["date"], c["channel_name"], c["msg_id"]), reverse=True
+        )
+        for c in results:
+            self._log_match(c)
+        return results
+
+    async def _scan_all(
+        self,
+        limit: int,
+        max_age_days: int,
+        on_channel: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+    ) -> None:
+        """Scan broadcast channels concurrently, awaiting on_channel per channel."""
         cutoff = message_cutoff(max_age_days)
         logger.info(
             "Enumerating channels and scanning for candidate magazines "
@@ -189,61 +352,66 @@ class MagazineSearcher:
             max_age_days,
         )
 
-        async for dialog in self.client.iter_dialogs():
-            if not getattr(dialog.entity, "broadcast", False):
-                continue
-
-            title = dialog.name or "Unknown Channel"
-
-            logger.info(f"Scanning channel: {title}")
-
-            is_junk = False
-            channel_candidates = []
-            msg_count = 0
-
-            async for msg in self.client.iter_messages(dialog.id, limit=limit):
-                msg_count += 1
+        # (id, title, username) per broadcast channel, read off the Telethon
+        # entities once rather than on every message.
+        channels = [
+            (
+                d.id,
+                d.name or "Unknown Channel",
+                getattr(d.entity, "username", None),
+            )
+            async for d in self.client.iter_dialogs()
+            if getattr(d.entity, "broadcast", False)
+        ]
+        sem = asyncio.Semaphore(CHANNEL_SCAN_CONCURRENCY)
 
-                # Newest-first: stop once we leave the recency window.
-                if not is_message_recent(getattr(msg, "date", None), cutoff):
-                    break
+        async def _bounded(channel) -> None:
+            async with sem:
+                found = await self._scan_one(*channel, limit=limit, cutoff=cutoff)
+            await on_channel(found)
 
-                # Check for "junk" channels (APK/Software) early (first 20 messages)
-                if msg_count <= 20 and msg.media and hasattr(msg.media, "document"):
-                    for attr in msg.media.document.attributes:
-                        if isinstance(attr, DocumentAttributeFilename):
-                            if attr.file_name.lower().endswith(
-                                (".apk", ".exe", ".dmg", ".ipa")
-                            ):
-                                is_junk = True
-                                break
-
-                if is_junk:
-                    logger.info(f"Skipping junk/APK channel: {title}")
-                    channel_candidates = []  # Discard any gathered candidates
-                    break
+        await asyncio.gather(*[_bounded(ch) for ch in channels])
 
-                candidate = self._extract_candidate(
-                    msg,
-                    title,
-                    dialog.id,
-                    getattr(dialog.entity, "username", None),
-                )
-                if candidate:
-                    channel_candidates.append(candidate)
+    async def _scan_one(
+        self,
+        channel_id: int,
+        title: str,
+        username: Optional[str],
+        *,
+        limit: int,
+        cutoff: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Scan one broadcast channel; returns [] for junk/APK channels."""
+        channel_candidates = []
+        msg_count = 0
 
-            if not is_junk:
-                candidates.extend(channel_candidates)
+        async for msg in self.client.iter_messages(channel_id, limit=limit):
+            msg_count += 1
 
-        # Deduplicate by filename + size
-        deduped = {}
-        for c in candidates:
-            key = (c["filename"], c["size"])
-            if key not in deduped or c["date"] > deduped[key]["date"]:
-                deduped[key] = c
+            # Newest-first: stop once we leave the recency window.
+            if not is_message_recent(getattr(msg, "date", None), cutoff):
+                break
 
-        logger.info(f"Found {len(deduped)} unique candidates.")
-        return list(deduped.values())
+            # Junk detection shares this single message cursor: a junk upload in
+            # the first JUNK_PROBE_MESSAGES discards the channel outright.
+            if msg_count <= JUNK_PROBE_MESSAGES:
+                try:
+                    attributes = msg.media.document.attributes
+                except AttributeError:
+                    attributes = ()
+                for attr in attributes:
+                    if isinstance(attr, DocumentAttributeFilename):
+                        if attr.file_name.lower().endswith(JUNK_EXTS):
+                            logger.info(f"Skipping junk/APK channel: {title}")
+                            return []  # Discard any gathered candidates
+                        break
+
+            candidate = self._extract_candidate(msg, title, channel_id, username)
+            if candidate:
+                channel_candidates.append(candidate)
+
+        logger.info(f"Channel {title}: {len(channel_candidates)} candidates")
+        return channel_candidates
 
     def _extract_candidate(
         self,
@@ -252,11 +420,14 @@ class MagazineSearcher:
         channel_id: int,
         channel_username: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        if not msg.media or not hasattr(msg.media, "document"):
+        try:
+            document = msg.media.document
+            attributes = document.attributes
+        except AttributeError:  # no media, or media without a document
             return None
 
         filename = None
-        for attr in msg.media.document.attributes:
+        for attr in attributes:
             if isinstance(attr, DocumentAttributeFilename):
                 filename = attr.file_name
                 break
@@ -264,15 +435,12 @@ class MagazineSearcher:
         if not filename:
             return None
 
-        ext = Path(filename).suffix.lower()
-        valid_exts = {".pdf", ".epub", ".mobi", ".zip", ".rar"}
-
         # Heuristic: filename or caption suggests magazine
         caption = msg.message or ""
 
         # Relaxed logic: If it's a PDF/EPUB, it's likely a candidate even without explicit "magazine" keywords
         # The AI will filter out irrelevant stuff later.
-        is_potential_magazine = ext in valid_exts
+        is_potential_magazine = filename.lower().endswith(VALID_EXTS)
 
         if is_potential_magazine:
             # Language check (fast)
@@ -285,7 +453,7 @@ class MagazineSearcher:
                 "channel_username": channel_username,
                 "channel_name": channel_name,
                 "filename": filename,
-                "size": msg.media.document.size,
+                "size": document.size,
                 "date": msg.date.isoformat(),
                 "caption": caption,
                 "message": msg,
@@ -297,20 +465,28 @@ class MagazineSearcher:
             }
         return None
 
-    def _is_likely_english(self, filename: str, caption: str) -> bool:
+    @staticmethod
+    def _is_likely_english(filename: str, caption: str) -> bool:
         text = f"{filename} {caption}".strip()
         if not text:
             return False
 
-        # For short text, langdetect is unreliable. Let it pass to AI.
-        if len(text) < 50:
+        # Too short to judge; let the AI decide.
+        if len(text) < 8:
             return True
 
+        # Cheap C-level check: share of ASCII bytes in the UTF-8 encoding.
+        raw = text.encode("utf-8", "ignore")
+        ascii_ratio = len(raw.translate(None, _NON_ASCII_BYTES)) / len(raw)
+        if ascii_ratio < ENGLISH_ASCII_RATIO:
+            return False
+
+        # langdetect is slow and unreliable on filenames; only consult it
+        # when a long caption gives it enough text to work with.
+        if len(caption) <= LANGDETECT_MIN_CAPTION_CHARS:
+            return True
         try:
-            # Simple check: if mostly non-ascii, maybe not English?
-            # But langdetect is better.
-            lang = detect(text)
-            return lang == "en"
+            return detect(text) == "en"
         except Exception:
             return True  # Fallback to true if detection fails
 
@@ -327,77 +503,214 @@ class MagazineSearcher:
         )
 
     def _keyword_only_filter(
-        self, candidates: List[Dict[str, Any]], user_keywords: str
+        self,
+        candidates: List[Dict[str, Any]],
+        user_keywords: str,
+        log_matches: bool = True,
     ) -> List[Dict[str, Any]]:
         """Filter candidates by keyword in filename or caption (case-insensitive)."""
-        keywords_lower = user_keywords.lower().strip()
-        if not keywords_lower:
+        parts = user_keywords.split()
+        if not parts:
             return []
-        parts = [p.strip() for p in keywords_lower.split() if p]
+        # One case-insensitive alternation instead of a substring scan per part.
+        keyword_re = re.compile("|".join(map(re.escape, parts)), re.IGNORECASE)
         results = []
         for c in candidates:
-            text = f"{c.get('filename', '')} {c.get('caption', '')}".lower()
-            if any(p in text for p in parts):
+            if keyword_re.search(c.get("filename") or "") or keyword_re.search(
+                c.get("caption") or ""
+            ):
                 c["ai_decision"] = {
                     "decision": "RELEVANT",
                     "confidence": 0.8,
                     "reasons": ["Keyword match in filename/caption"],
                 }
                 results.append(c)
-                self._log_match(c)
+                if log_matches:
+                    self._log_match(c)
         return results
 
+    def _llm_slots(self) -> asyncio.Queue:
+        """Queue of batch_concurrency model-request slots.
+
+        Each entry is the loop time at which that slot may send its next
+        request; see _paced_llm_batch.
+        """
+        slots: asyncio.Queue = asyncio.Queue()
+        for _ in range(max(1, self.batch_concurrency)):
+            slots.put_nowait(0.0)
+        return slots
+
+    async def _paced_llm_batch(
+        self, llm_slots: asyncio.Queue, items: List[Dict[str, Any]], keywords: str
+    ) -> Dict[str, Any]:
+        """_call_llm_batch on a free slot; a slot waits batch_delay between requests."""
+        loop = asyncio.get_running_loop()
+        ready_at = await llm_slots.get()
+        try:
+            wait = ready_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await self._call_llm_batch(items, keywords)
+        finally:
+            llm_slots.put_nowait(loop.time() + self.batch_delay)
+
     async def evaluate_candidates(
-        self, candidates: List[Dict[str, Any]], user_keywords: str
+        self,
+        candidates: List[Dict[str, Any]],
+        user_keywords: str,
+        *,
+        llm_slots: Optional[asyncio.Queue] = None,
+        log_matches: bool = True,
     ) -> List[Dict[str, Any]]:
+        """Return the RELEVANT candidates, each with its "ai_decision" set.
+
+        Model requests go through llm_slots (a fresh _llm_slots() queue by
+        default), so callers evaluating several candidate lists can share one
+        concurrency and pacing budget. With log_matches=False the caller logs
+        [MATCH] lines itself.
+        """
         if self.keyword_only:
-            return self._keyword_only_filter(candidates, user_keywords)
+            return self._keyword_only_filter(candidates, user_keywords, log_matches)
+        if llm_slots is None:
+            llm_slots = self._llm_slots()
 
         results = []
-        to_evaluate = []
-        for c in candidates:
-            cache_key = hashlib.sha256(
-                f"{user_keywords}:{c['filename']}:{c['size']}".encode()
-            ).hexdigest()
-            cache_path = CACHE_DIR / f"{cache_key}.json"
-            if self.cache_enabled and cache_path.exists():
-                with open(cache_path, "r") as f:
-                    c["ai_decision"] = json.load(f)
-                    if c["ai_decision"].get("decision") == "RELEVANT":
-                        results.append(c)
+        # Filenames containing every keyword token as a whole word are relevant
+        # without asking the model ("art" must not match "Smart_Computing").
+        kw_tokens = [t.lower() for t in re.split(r"\W+", user_keywords) if t]
+        if kw_tokens:
+            remaining = []
+            for c in candidates:
+                words = set(re.split(r"[\W_]+", c["filename"].lower()))
+                if all(t in words for t in kw_tokens):
+                    c["ai_decision"] = {
+                        "decision": "RELEVANT",
+                        "confidence": 1.0,
+                        "reasons": ["Keyword match in filename"],
+                    }
+                    results.append(c)
+                    if log_matches:
+                        self._log_match(c)
+                else:
+                    remaining.append(c)
+            candidates = remaining
+
+        # An explicit verdict for these exact keywords wins over anything
+        # inferred from cached topics.
+        uncached = []
+        uncached_keys = []
+        cache_keys = [self._cache_key(user_keywords, c) for c in candidates]
+        cached = (
+            cache_get_many(self._cache_db, cache_keys)
+            if self._cache_db is not None
+            else {}
+        )
+        for c, cache_key in zip(candidates, cache_keys):
+            decision = cached.get(cache_key)
+            if decision is not None:
+                c["ai_decision"] = decision
+                if decision.get("decision") == "RELEVANT":
+                    results.append(c)
+                    if log_matches:
                         self._log_match(c)
                 continue
+            uncached.append(c)
+            uncached_keys.append(cache_key)
+
+        # Topics the model reported for a file in earlier runs don't depend on
+        # the keywords, so a new search can reuse them without a model call.
+        to_evaluate = []
+        eval_cache_keys = []
+        topics_by_key = {}
+        if kw_tokens and self._cache_db is not None and uncached:
+            topic_keys = [self._topic_key(c) for c in uncached]
+            cached_topics = cache_get_many(self._cache_db, topic_keys, table="t")
+            topics_by_key = {
+                k: cached_topics.get(t, {}).get("topics", [])
+                for k, t in zip(uncached_keys, topic_keys)
+            }
+        for c, cache_key in zip(uncached, uncached_keys):
+            topics = topics_by_key.get(cache_key, [])
+            if topics_cover_keywords(topics, kw_tokens):
+                c["ai_decision"] = {
+                    "decision": "RELEVANT",
+                    "confidence": 0.9,
+                    "reasons": ["Cached topic match"],
+                    "topics": topics,
+                }
+                results.append(c)
+                if log_matches:
+                    self._log_match(c)
+                continue
             to_evaluate.append(c)
+            eval_cache_keys.append(cache_key)
+
+        starts = range(0, len(to_evaluate), self.batch_size)
 
-        for i in range(0, len(to_evaluate), self.batch_size):
+        async def _evaluate_batch(i: int) -> List[Dict[str, Any]]:
             batch = to_evaluate[i : i + self.batch_size]
+            batch_cache_keys = eval_cache_keys[i : i + self.batch_size]
+            metadata_list = self._prompt_items(batch)
             logger.info(f"Evaluating batch of {len(batch)} magazines...")
-            metadata_list = [
-                {
-                    "id": idx,
-                    "filename": c["filename"],
-                    "caption": (c.get("caption") or "")[:CAPTION_PROMPT_CHARS],
-                }
-                for idx, c in enumerate(batch)
-            ]
-            decisions = await self._call_llm_batch(metadata_list, user_keywords)
+            decisions = await self._paced_llm_batch(
+                llm_slots, metadata_list, user_keywords
+            )
+            relevant = []
             for idx, c in enumerate(batch):
                 decision = decisions.get(str(idx), {"decision": "NOT_RELEVANT"})
                 c["ai_decision"] = decision
-                if self.cache_enabled:
-                    cache_key = hashlib.sha256(
-                        f"{user_keywords}:{c['filename']}:{c['size']}".encode()
-                    ).hexdigest()
-                    cache_path = CACHE_DIR / f"{cache_key}.json"
-                    with open(cache_path, "w") as f:
-                        json.dump(decision, f)
                 if decision.get("decision") == "RELEVANT":
-                    results.append(c)
-                    self._log_match(c)
-            if self.batch_delay > 0 and i + self.batch_size < len(to_evaluate):
-                await asyncio.sleep(self.batch_delay)
+                    relevant.append(c)
+                    if log_matches:
+                        self._log_match(c)
+            if self._cache_db is not None:
+                cache_put_many(
+                    self._cache_db,
+                    zip(batch_cache_keys, (c["ai_decision"] for c in batch)),
+                )
+                cache_put_many(
+                    self._cache_db,
+                    (
+                        (self._topic_key(c), {"topics": c["ai_decision"]["topics"]})
+                        for c in batch
+                        if c["ai_decision"].get("topics")
+                    ),
+                    table="t",
+                )
+            return relevant
+
+        # Batches finish in any order; gather keeps their results in batch
+        # order so saved output is deterministic.
+        for relevant in await asyncio.gather(*[_evaluate_batch(i) for i in starts]):
+            results.extend(relevant)
         return results
 
+    @staticmethod
+    def _prompt_items(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Minimal per-item prompt payload; empty captions are omitted."""
+        items = []
+        for idx, c in enumerate(batch):
+            item = {"id": idx, "filename": c["filename"]}
+            caption = (c.get("caption") or "").strip()[:CAPTION_PROMPT_CHARS]
+            if caption:
+                item["caption"] = caption
+            items.append(item)
+        return items
+
+    @staticmethod
+    def _topic_key(c: Dict[str, Any]) -> bytes:
+        """Keyword-independent digest for a file's cached topics."""
+        return hashlib.blake2b(
+            f"{c['filename']}:{c['size']}".encode(), digest_size=8
+        ).digest()
+
+    @staticmethod
+    def _cache_key(user_keywords: str, c: Dict[str, Any]) -> bytes:
+        """Short, non-cryptographic digest identifying a cached AI decision."""
+        return hashlib.blake2b(
+            f"{user_keywords}:{c['filename']}:{c['size']}".encode(), digest_size=8
+        ).digest()
+
     def _log_match(self, c: Dict[str, Any]):
         size_mb = c["size"] / (1024 * 1024)
         logger.info(
@@ -412,7 +725,8 @@ class MagazineSearcher:
 Items: {json.dumps(items, ensure_ascii=False, separators=(",", ":"))}
 
 Return ONLY a JSON object. Keys are item id strings. Each value is:
-{{"decision":"RELEVANT"|"NOT_RELEVANT"|"UNCERTAIN","confidence":0.0}}
+{{"decision":"RELEVANT"|"NOT_RELEVANT"|"UNCERTAIN","confidence":0.0,"topics":["word"]}}
+"topics" lists up to {MAX_TOPICS} lowercase single words naming what the magazine covers.
 No markdown. No extra keys. No trailing commas."""
 
     async def _call_llm_batch(
@@ -566,7 +880,7 @@ No markdown. No extra keys. No trailing commas."""
 
     @staticmethod
     def _normalize_decisions(raw: Dict[str, Any]) -> Dict[str, Any]:
-        """Coerce model output into {id: {decision, confidence, reasons}}."""
+        """Coerce model output into {id: {decision, confidence, reasons, topics}}."""
         out: Dict[str, Any] = {}
         for key, value in raw.items():
             sid = str(key)
@@ -601,10 +915,17 @@ No markdown. No extra keys. No trailing commas."""
                 reasons = [reasons]
             elif not isinstance(reasons, list):
                 reasons = []
+            topics = value.get("topics", [])
+            if isinstance(topics, str):
+                topics = [topics]
+            elif not isinstance(topics, list):
+                topics = []
+            topics = [str(t).strip().lower() for t in topics if str(t).strip()]
             out[sid] = {
                 "decision": decision,
                 "confidence": confidence,
                 "reasons": reasons,
+                "topics": topics[:MAX_TOPICS],
             }
         return out
 
@@ -615,18 +936,19 @@ def save_outputs(results: List[Dict[str, Any]], keywords: str):
     md_path = OUTPUT_DIR / f"find_magazine_{timestamp}.md"
 
     # Save JSON
-    with open(json_path, "w") as f:
-        json.dump(
-            {
-                "keywords": keywords,
-                "timestamp": timestamp,
-                "total_matches": len(results),
-                "results": [
-                    {k: v for k, v in r.items() if k != "message"} for r in results
-                ],
-            },
-            f,
-            indent=2,
+    with open(json_path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                {
+                    "keywords": keywords,
+                    "timestamp": timestamp,
+                    "total_matches": len(results),
+                    "results": [
+                        {k: v for k, v in r.items() if k != "message"} for r in results
+                    ],
+                },
+                option=orjson.OPT_INDENT_2,
+            )
         )
 
     # Save Markdown
@@ -681,7 +1003,20 @@ async def main():
         "--batch-delay",
         type=float,
         default=DEFAULT_BATCH_DELAY,
-        help=f"Seconds to wait between AI batches (default {DEFAULT_BATCH_DELAY})",
+        help=(
+            "Seconds each concurrent AI request slot waits before its next "
+            f"request (default {DEFAULT_BATCH_DELAY})"
+        ),
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=(
+            f"AI batches evaluated concurrently (default {DEFAULT_BATCH_CONCURRENCY}); "
+            "each slot waits --batch-delay between requests, so N slots send "
+            "N times as many requests"
+        ),
     )
     parser.add_argument(
         "--batch-size",
@@ -720,16 +1055,16 @@ async def main():
         api_hash,
         batch_size=args.batch_size,
         batch_delay=args.batch_delay,
+        batch_concurrency=args.batch_concurrency,
         keyword_only=args.keyword_only,
         openai_client=openai_client,
         openai_model=openai_model,
     )
     try:
         await searcher.start()
-        candidates = await searcher.scan_channels(
-            limit=args.limit, max_age_days=max_age_days
+        results = await searcher.scan_and_evaluate(
+            args.keywords, limit=args.limit, max_age_days=max_age_days
         )
-        results = await searcher.evaluate_candidates(candidates, args.keywords)
         save_outputs(results, args.keywords)
         logger.info("Done! Results saved to %s", OUTPUT_DIR)
     finally:
@@ -737,4 +1072,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
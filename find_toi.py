@@ -18,7 +18,7 @@ import os
 import re
 import sqlite3
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional
 
@@ -26,6 +26,7 @@ from dotenv import load_dotenv
 
 from openai_compat import OpenAICompatConfigError, load_openai_compat
 from telegram_links import message_deep_link
+from telegram_session import run_event_loop, tune_session_db
 
 load_dotenv()
 try:
@@ -72,6 +73,8 @@ NEWSPAPER_PROFILES = {
 DEFAULT_NEWSPAPER = "toi"
 DEFAULT_KEYWORDS = NEWSPAPER_PROFILES[DEFAULT_NEWSPAPER]["keywords"]
 SESSION_NAME = "toi_session"
+CHANNEL_SCAN_CONCURRENCY = 8
+HYD_REGEX = re.compile(r"hyd(?:erabad)?", re.IGNORECASE)
 
 
 def get_env_api_credentials():
@@ -115,7 +118,7 @@ def keyword_to_pattern(keyword: str) -> str:
 def compile_matchers(
     keywords: List[str], date_str: str, newspaper: str = DEFAULT_NEWSPAPER
 ):
-    """Build regexes for the selected Hyderabad newspaper and date component."""
+    """Build (paper, Hyderabad, date) regexes for the selected newspaper."""
     # Parse the input date (DD-MM-YYYY)
     try:
         dt = datetime.strptime(date_str, "%d-%m-%Y")
@@ -143,13 +146,12 @@ def compile_matchers(
         paper_patterns = [keyword_to_pattern(k) for k in keywords]
     paper_pattern = "|".join(paper_patterns)
 
-    # Match files that contain the selected paper and Hyderabad/Hyd in any order.
-    base_regex = re.compile(
-        rf"(?=.*(?:{paper_pattern}))(?=.*(?:hyd|hyderabad))",
-        re.IGNORECASE,
-    )
+    # Independent patterns (paper, Hyderabad/Hyd, date) so a filename is
+    # scanned once per pattern and the caller can short-circuit on a miss,
+    # instead of chained lookaheads re-scanning it from every offset.
+    paper_regex = re.compile(paper_pattern, re.IGNORECASE)
     date_regex = re.compile(date_pattern, re.IGNORECASE)
-    return base_regex, date_regex
+    return paper_regex, HYD_REGEX, date_regex
 
 
 def should_scan_message_date(msg_date, target_date) -> bool:
@@ -162,6 +164,19 @@ def should_scan_message_date(msg_date, target_date) -> bool:
     return target_date - timedelta(days=2) <= msg_date <= target_date + timedelta(days=1)
 
 
+def scan_offset_date(target_date) -> Optional[datetime]:
+    """Exclusive upper bound of the scan window, for iter_messages(offset_date=...).
+
+    Telegram then starts each channel at the newest message inside the window
+    instead of streaming everything posted after it.
+    """
+    if not target_date:
+        return None
+    return datetime.combine(
+        target_date + timedelta(days=2), time.min, tzinfo=timezone.utc
+    )
+
+
 def is_target_day_post(msg_date, target_date) -> bool:
     """Return True when the Telegram message itself was posted on the target day."""
     return bool(msg_date and target_date and msg_date == target_date)
@@ -169,20 +184,22 @@ def is_target_day_post(msg_date, target_date) -> bool:
 
 def extract_filename_from_message(msg: Message) -> Optional[str]:
     """Extract filename from a Telethon message with media attachment."""
-    # Check for document attribute
-    if hasattr(msg, "document") and msg.document:
-        attrs = getattr(msg.document, "attributes", []) or []
-        for attr in attrs:
-            if isinstance(attr, DocumentAttributeFilename):
-                return attr.file_name
+    try:
+        attrs = msg.document.attributes or ()
+    except AttributeError:  # no document (msg.document is None)
+        return None
+    for attr in attrs:
+        if isinstance(attr, DocumentAttributeFilename):
+            return attr.file_name
     return None
 
 
 def get_file_size(msg: Message) -> int:
     """Get file size in bytes from message."""
-    if hasattr(msg, "document") and msg.document:
-        return getattr(msg.document, "size", 0)
-    return 0
+    try:
+        return msg.document.size or 0
+    except AttributeError:
+        return 0
 
 
 def get_deep_link(dialog, msg) -> str:
@@ -254,8 +271,11 @@ async def find_matching_files(
 
     logger.info(f"Using session file: {session_file}")
     client = TelegramClient(SESSION_NAME, int(api_id), api_hash)
+    tune_session_db(client)
 
-    base_regex, date_regex = compile_matchers(keywords, date_str, newspaper)
+    paper_regex, hyd_regex, date_regex = compile_matchers(
+        keywords, date_str, newspaper
+    )
 
     # Parse target date for message filtering
     try:
@@ -275,7 +295,8 @@ async def find_matching_files(
         logger.info(
             "Starting channel scan (filtering for newspaper/epaper channels only)..."
         )
-        scanned = 0
+        offset_date = scan_offset_date(target_date)
+        channels = []
         async for dialog in client.iter_dialogs():
             # only channels (broadcast)
             if not getattr(dialog.entity, "broadcast", False):
@@ -288,14 +309,19 @@ async def find_matching_files(
             _channel_filters = ("newspapers", "newspaper", "epaper", "paper", "epapers")
             if not any(k in title_l for k in _channel_filters):
                 logger.debug(
-                    f"Skipping channel (no newspaper keywords in name): {title}"
+                    "Skipping channel (no newspaper keywords in name): %s", title
                 )
                 continue
 
-            scanned += 1
+            channels.append((dialog, title))
+
+        async def scan_channel(scanned: int, dialog, title: str):
             logger.info(f"[{scanned}] Scanning channel: {title}")
+            channel_matches = []
 
-            async for msg in client.iter_messages(dialog.id, limit=None):
+            async for msg in client.iter_messages(
+                dialog.id, limit=None, offset_date=offset_date
+            ):
                 if not getattr(msg, "media", None):
                     continue
 
@@ -310,7 +336,8 @@ async def find_matching_files(
                         if msg_date < target_date - timedelta(days=2):
                             # Telegram yields messages newest to oldest. If we hit much older messages, stop scanning.
                             logger.debug(
-                                f"Reached messages older than {target_date - timedelta(days=2)}. Breaking early."
+                                "Reached messages older than %s. Breaking early.",
+                                target_date - timedelta(days=2),
                             )
                             break
                         if not should_scan_message_date(msg_date, target_date):
@@ -324,22 +351,42 @@ async def find_matching_files(
                 if ai_query:
                     is_match = True
                 else:
-                    has_base_match = bool(base_regex.search(fname))
-                    has_date_in_filename = bool(date_regex.search(fname))
-                    posted_on_target_day = is_target_day_post(msg_date, target_date)
-                    is_match = has_base_match and (
-                        has_date_in_filename or posted_on_target_day
+                    # Short-circuits on the first pattern that misses.
+                    is_match = bool(
+                        paper_regex.search(fname)
+                        and hyd_regex.search(fname)
+                        and (
+                            is_target_day_post(msg_date, target_date)
+                            or date_regex.search(fname)
+                        )
                     )
 
                 if is_match:
                     size = get_file_size(msg)
-                    matches.append((dialog, msg, fname, title, size))
+                    channel_matches.append((dialog, msg, fname, title, size))
                     size_mb = size / (1024 * 1024) if size else 0.0
                     if not ai_query:
                         deep_link = get_deep_link(dialog, msg)
                         logger.info(
                             f"[MATCH] {fname} | Channel: {title} | Size: {size_mb:.2f} MB | msg_id: {msg.id} | Link: {deep_link}"
                         )
+            return channel_matches
+
+        # Channels are independent network work; scan a bounded number at once.
+        sem = asyncio.Semaphore(CHANNEL_SCAN_CONCURRENCY)
+
+        async def bounded_scan(scanned: int, dialog, title: str):
+            async with sem:
+                return await scan_channel(scanned, dialog, title)
+
+        results = await asyncio.gather(
+            *[
+                bounded_scan(idx, dialog, title)
+                for idx, (dialog, title) in enumerate(channels, 1)
+            ]
+        )
+        for channel_matches in results:
+            matches.extend(channel_matches)
 
         if not matches:
             logger.warning(f"No matching files found for {date_str}")
@@ -448,7 +495,7 @@ def main(argv=None):
         keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
 
     try:
-        return_code = asyncio.run(
+        return_code = run_event_loop(
             find_matching_files(
                 keywords=keywords,
                 date_str=date_str,
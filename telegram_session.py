@@ -0,0 +1,48 @@
+"""Telethon session and event-loop helpers shared by the magazine and TOI scanners."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from typing import Any, Coroutine
+
+logger = logging.getLogger(__name__)
+
+SESSION_BUSY_TIMEOUT_MS = 30000
+
+
+def tune_session_db(client, busy_timeout_ms: int = SESSION_BUSY_TIMEOUT_MS) -> bool:
+    """Switch the client's SQLite session to WAL with a busy timeout.
+
+    WAL lets readers and the writer proceed concurrently, and busy_timeout
+    makes SQLite wait for a lock in C instead of raising "database is
+    locked" straight away. journal_mode persists in the session file;
+    busy_timeout applies to Telethon's open connection. Call after
+    constructing TelegramClient and before start(). Returns False for
+    non-SQLite sessions or when the pragmas could not be applied.
+    """
+    conn = getattr(getattr(client, "session", None), "_conn", None)
+    if not isinstance(conn, sqlite3.Connection):
+        return False
+    try:
+        conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.OperationalError as e:
+        logger.warning("Could not enable WAL on Telegram session: %s", e)
+        return False
+    return True
+
+
+def run_event_loop(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run main to completion, on uvloop's libuv-based loop when installed.
+
+    uvloop is not available on Windows; there, or if it isn't installed,
+    this is plain asyncio.run.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
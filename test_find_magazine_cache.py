@@ -0,0 +1,96 @@
+"""Unit tests for the magazine AI decision cache."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from find_magazine import (
+    MagazineSearcher,
+    cache_get_many,
+    cache_put_many,
+    open_decision_cache,
+    topics_cover_keywords,
+)
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_key_is_short_digest(self) -> None:
+        key = MagazineSearcher._cache_key("time", {"filename": "a.pdf", "size": 1})
+        self.assertIsInstance(key, bytes)
+        self.assertEqual(len(key), 8)
+
+    def test_key_depends_on_keywords_filename_and_size(self) -> None:
+        c = {"filename": "a.pdf", "size": 1}
+        key = MagazineSearcher._cache_key("time", c)
+        self.assertEqual(key, MagazineSearcher._cache_key("time", dict(c)))
+        self.assertNotEqual(key, MagazineSearcher._cache_key("forbes", c))
+        self.assertNotEqual(
+            key, MagazineSearcher._cache_key("time", {"filename": "a.pdf", "size": 2})
+        )
+
+
+class DecisionCacheStoreTests(unittest.TestCase):
+    def test_round_trip_and_replace(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = open_decision_cache(Path(tmp) / "sub" / "cache.db")
+            try:
+                cache_put_many(
+                    conn,
+                    [
+                        (b"k1", {"decision": "RELEVANT", "confidence": 0.9}),
+                        (b"k2", {"decision": "NOT_RELEVANT", "confidence": 0.1}),
+                    ],
+                )
+                cache_put_many(conn, [(b"k2", {"decision": "UNCERTAIN"})])
+                found = cache_get_many(conn, [b"k1", b"k2", b"missing", b"k1"])
+            finally:
+                conn.close()
+        self.assertEqual(set(found), {b"k1", b"k2"})
+        self.assertEqual(found[b"k1"]["confidence"], 0.9)
+        self.assertEqual(found[b"k2"]["decision"], "UNCERTAIN")
+
+    def test_lookup_spans_multiple_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = open_decision_cache(Path(tmp) / "cache.db")
+            try:
+                keys = [i.to_bytes(4, "big") for i in range(1200)]
+                cache_put_many(conn, ((k, {"decision": "RELEVANT"}) for k in keys))
+                found = cache_get_many(conn, keys)
+            finally:
+                conn.close()
+        self.assertEqual(len(found), 1200)
+
+    def test_topic_table_is_separate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = open_decision_cache(Path(tmp) / "cache.db")
+            try:
+                cache_put_many(conn, [(b"k", {"topics": ["science"]})], table="t")
+                self.assertEqual(cache_get_many(conn, [b"k"]), {})
+                found = cache_get_many(conn, [b"k"], table="t")
+            finally:
+                conn.close()
+        self.assertEqual(found[b"k"]["topics"], ["science"])
+
+
+class TopicKeyTests(unittest.TestCase):
+    def test_topic_key_ignores_keywords(self) -> None:
+        c = {"filename": "a.pdf", "size": 1}
+        self.assertEqual(len(MagazineSearcher._topic_key(c)), 8)
+        self.assertNotEqual(
+            MagazineSearcher._topic_key(c),
+            MagazineSearcher._topic_key({"filename": "a.pdf", "size": 2}),
+        )
+
+    def test_topics_cover_all_keyword_tokens(self) -> None:
+        topics = ["science", "space exploration"]
+        self.assertTrue(topics_cover_keywords(topics, ["space"]))
+        self.assertTrue(topics_cover_keywords(topics, ["science", "space"]))
+        self.assertFalse(topics_cover_keywords(topics, ["science", "finance"]))
+        self.assertFalse(topics_cover_keywords([], ["science"]))
+        self.assertFalse(topics_cover_keywords(topics, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
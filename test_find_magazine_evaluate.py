@@ -0,0 +1,262 @@
+"""Unit tests for batched AI evaluation of magazine candidates."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from telethon.tl.types import DocumentAttributeFilename
+
+from find_magazine import MagazineSearcher, open_decision_cache
+
+
+def make_candidate(filename: str, caption: str = "") -> dict:
+    return {
+        "filename": filename,
+        "caption": caption,
+        "channel_name": "Test Channel",
+        "size": 1024,
+        "msg_id": 1,
+        "link": "tg://privatepost?channel=1&post=1",
+    }
+
+
+def make_searcher(**attrs) -> MagazineSearcher:
+    """MagazineSearcher with evaluation settings only (no Telegram/AI clients).
+
+    Defaults: keyword_only=False, batch_size=10, batch_delay=0,
+    batch_concurrency=1, _cache_db=None; keyword arguments override them.
+    """
+    searcher = MagazineSearcher.__new__(MagazineSearcher)
+    searcher.keyword_only = False
+    searcher.batch_size = 10
+    searcher.batch_delay = 0
+    searcher.batch_concurrency = 1
+    searcher._cache_db = None
+    for name, value in attrs.items():
+        setattr(searcher, name, value)
+    return searcher
+
+
+class ConcurrentBatchTests(unittest.TestCase):
+    def test_batches_run_concurrently_up_to_limit(self) -> None:
+        searcher = make_searcher(batch_size=2, batch_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_batch(items, keywords):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {str(i["id"]): {"decision": "RELEVANT"} for i in items}
+
+        searcher._call_llm_batch = fake_batch
+        candidates = [make_candidate(f"mag{i}.pdf") for i in range(7)]
+        results = asyncio.run(searcher.evaluate_candidates(candidates, "science"))
+        self.assertEqual(len(results), 7)
+        self.assertEqual(peak, 2)
+
+    def test_results_keep_batch_order(self) -> None:
+        searcher = make_searcher(batch_size=1, batch_concurrency=3)
+
+        async def fake_batch(items, keywords):
+            # Earlier batches finish last.
+            await asyncio.sleep(0.03 - 0.01 * int(items[0]["filename"][3]))
+            return {"0": {"decision": "RELEVANT"}}
+
+        searcher._call_llm_batch = fake_batch
+        candidates = [make_candidate(f"mag{i}.pdf") for i in range(3)]
+        results = asyncio.run(searcher.evaluate_candidates(candidates, "science"))
+        self.assertEqual(
+            [c["filename"] for c in results], ["mag0.pdf", "mag1.pdf", "mag2.pdf"]
+        )
+
+
+class CachedTopicTests(unittest.TestCase):
+    def test_topics_from_earlier_search_answer_new_keywords(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            searcher = make_searcher(
+                _cache_db=open_decision_cache(Path(tmp) / "cache.db")
+            )
+            try:
+                searcher._call_llm_batch = AsyncMock(
+                    return_value={
+                        "0": {
+                            "decision": "NOT_RELEVANT",
+                            "confidence": 0.8,
+                            "reasons": [],
+                            "topics": ["astronomy", "space"],
+                        }
+                    }
+                )
+                first = asyncio.run(
+                    searcher.evaluate_candidates([make_candidate("Sky.pdf")], "finance")
+                )
+                self.assertEqual(first, [])
+
+                searcher._call_llm_batch = AsyncMock(return_value={})
+                second = asyncio.run(
+                    searcher.evaluate_candidates([make_candidate("Sky.pdf")], "space")
+                )
+            finally:
+                searcher._cache_db.close()
+        self.assertEqual(len(second), 1)
+        self.assertEqual(second[0]["ai_decision"]["reasons"], ["Cached topic match"])
+        searcher._call_llm_batch.assert_not_called()
+
+    def test_cached_verdict_for_same_keywords_beats_topics(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            searcher = make_searcher(
+                _cache_db=open_decision_cache(Path(tmp) / "cache.db")
+            )
+            try:
+                searcher._call_llm_batch = AsyncMock(
+                    return_value={
+                        "0": {
+                            "decision": "NOT_RELEVANT",
+                            "confidence": 0.7,
+                            "reasons": [],
+                            "topics": ["space", "fiction"],
+                        }
+                    }
+                )
+                first = asyncio.run(
+                    searcher.evaluate_candidates([make_candidate("Sky.pdf")], "space")
+                )
+                second = asyncio.run(
+                    searcher.evaluate_candidates([make_candidate("Sky.pdf")], "space")
+                )
+            finally:
+                searcher._cache_db.close()
+        self.assertEqual(first, [])
+        self.assertEqual(second, [])
+        searcher._call_llm_batch.assert_awaited_once()
+
+
+class PacingTests(unittest.TestCase):
+    def test_batches_without_model_calls_are_not_delayed(self) -> None:
+        searcher = make_searcher(batch_size=1, batch_delay=0.2)
+        searcher._call_llm_batch = AsyncMock(return_value={})
+        candidates = [make_candidate(f"Science_{i}.pdf") for i in range(4)]
+        started = time.monotonic()
+        results = asyncio.run(searcher.evaluate_candidates(candidates, "science"))
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertEqual(len(results), 4)
+        searcher._call_llm_batch.assert_not_called()
+
+    def test_model_calls_on_one_slot_wait_batch_delay(self) -> None:
+        searcher = make_searcher(batch_size=1, batch_delay=0.2)
+        searcher._call_llm_batch = AsyncMock(return_value={})
+        candidates = [make_candidate(f"mag{i}.pdf") for i in range(3)]
+        started = time.monotonic()
+        asyncio.run(searcher.evaluate_candidates(candidates, "science"))
+        elapsed = time.monotonic() - started
+        self.assertEqual(searcher._call_llm_batch.await_count, 3)
+        # Two waits between three requests; none after the last.
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.6)
+
+    def test_keyword_only_pipeline_does_not_sleep(self) -> None:
+        searcher = make_searcher(keyword_only=True, batch_size=1, batch_delay=0.5)
+        searcher.client = _FakeClient(
+            {1: ("Mags", [_message(i, f"Science_{i}.pdf") for i in range(4)])}
+        )
+        started = time.monotonic()
+        results = asyncio.run(searcher.scan_and_evaluate("science"))
+        self.assertLess(time.monotonic() - started, 0.25)
+        self.assertEqual(len(results), 4)
+
+
+def _message(msg_id: int, filename: str, age_days: int = 0) -> SimpleNamespace:
+    document = SimpleNamespace(
+        attributes=[DocumentAttributeFilename(file_name=filename)], size=1024
+    )
+    return SimpleNamespace(
+        id=msg_id,
+        date=datetime.now(timezone.utc) - timedelta(days=age_days),
+        media=SimpleNamespace(document=document),
+        message="",
+    )
+
+
+class _FakeClient:
+    def __init__(self, channels):
+        self.channels = channels
+
+    async def iter_dialogs(self):
+        for channel_id, (name, _) in self.channels.items():
+            yield SimpleNamespace(
+                id=channel_id,
+                name=name,
+                entity=SimpleNamespace(broadcast=True, username=None),
+            )
+
+    async def iter_messages(self, channel_id, limit=None):
+        for msg in self.channels[channel_id][1]:
+            yield msg
+
+
+class ScanAndEvaluateTests(unittest.TestCase):
+    def test_pipeline_dedupes_and_reports_newest_copy(self) -> None:
+        searcher = make_searcher(batch_size=1, batch_concurrency=2)
+        searcher.client = _FakeClient(
+            {
+                1: ("Old", [_message(10, "Nature.pdf", age_days=5)]),
+                2: ("New", [_message(20, "Nature.pdf"), _message(21, "Vogue.pdf")]),
+                3: ("Apps", [_message(30, "Science.pdf"), _message(31, "app.apk")]),
+            }
+        )
+
+        async def fake_batch(items, keywords):
+            return {
+                str(i["id"]): {
+                    "decision": (
+                        "RELEVANT" if i["filename"] == "Nature.pdf" else "NOT_RELEVANT"
+                    )
+                }
+                for i in items
+            }
+
+        searcher._call_llm_batch = AsyncMock(side_effect=fake_batch)
+        with self.assertLogs("find_magazine", level="INFO") as logs:
+            results = asyncio.run(searcher.scan_and_evaluate("science"))
+
+        self.assertEqual([c["filename"] for c in results], ["Nature.pdf"])
+        self.assertEqual(results[0]["msg_id"], 20)
+        self.assertEqual(results[0]["ai_decision"]["decision"], "RELEVANT")
+        matches = [line for line in logs.output if "[MATCH]" in line]
+        self.assertEqual(len(matches), 1)
+        self.assertIn("msg_id: 20", matches[0])
+        evaluated = [
+            item["filename"]
+            for call in searcher._call_llm_batch.call_args_list
+            for item in call.args[0]
+        ]
+        self.assertEqual(sorted(evaluated), ["Nature.pdf", "Vogue.pdf"])
+
+    def test_pipeline_results_are_sorted_newest_first(self) -> None:
+        searcher = make_searcher(keyword_only=True, batch_size=1)
+        searcher.client = _FakeClient(
+            {
+                1: ("A", [_message(10, "Science_Old.pdf", age_days=9)]),
+                2: ("B", [_message(20, "Science_New.pdf", age_days=1)]),
+                3: ("C", [_message(30, "Science_Mid.pdf", age_days=4)]),
+            }
+        )
+        results = asyncio.run(searcher.scan_and_evaluate("science"))
+        self.assertEqual(
+            [c["filename"] for c in results],
+            ["Science_New.pdf", "Science_Mid.pdf", "Science_Old.pdf"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
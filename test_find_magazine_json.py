@@ -5,7 +5,10 @@ from __future__ import annotations
 import unittest
 
 from find_magazine import (
+    CAPTION_PROMPT_CHARS,
+    DEFAULT_BATCH_SIZE,
     MAX_COMPLETION_TOKENS_CAP,
+    TOKENS_PER_DECISION,
     MagazineSearcher,
     _is_context_overflow_error,
     completion_token_budget,
@@ -33,13 +36,29 @@ class ParseLlmJsonTests(unittest.TestCase):
         raw = {
             "0": "RELEVANT",
             "1": {"decision": "R", "confidence": "0.8"},
-            "2": {"decision": "maybe", "confidence": 0.4},
+            "2": {"decision": "maybe", "confidence": 0.4, "topics": ["Science"]},
         }
         out = MagazineSearcher._normalize_decisions(raw)
         self.assertEqual(out["0"]["decision"], "RELEVANT")
         self.assertEqual(out["1"]["decision"], "RELEVANT")
         self.assertEqual(out["1"]["confidence"], 0.8)
         self.assertEqual(out["2"]["decision"], "UNCERTAIN")
+        self.assertEqual(out["2"]["topics"], ["science"])
+        self.assertEqual(out["1"]["topics"], [])
+
+
+class PromptItemsTests(unittest.TestCase):
+    def test_omits_empty_captions_and_truncates_long_ones(self) -> None:
+        items = MagazineSearcher._prompt_items(
+            [
+                {"filename": "a.pdf", "caption": "  "},
+                {"filename": "b.pdf", "caption": None},
+                {"filename": "c.pdf", "caption": "x" * 500},
+            ]
+        )
+        self.assertEqual(items[0], {"id": 0, "filename": "a.pdf"})
+        self.assertEqual(items[1], {"id": 1, "filename": "b.pdf"})
+        self.assertEqual(len(items[2]["caption"]), CAPTION_PROMPT_CHARS)
 
 
 class CompletionTokenBudgetTests(unittest.TestCase):
@@ -48,7 +67,16 @@ class CompletionTokenBudgetTests(unittest.TestCase):
         large = completion_token_budget(500)
         self.assertGreaterEqual(small, 512)
         self.assertLessEqual(large, MAX_COMPLETION_TOKENS_CAP)
-        self.assertEqual(completion_token_budget(50), min(4096, 50 * 48 + 256))
+        self.assertEqual(completion_token_budget(20), 20 * TOKENS_PER_DECISION + 256)
+        self.assertEqual(
+            completion_token_budget(50),
+            min(MAX_COMPLETION_TOKENS_CAP, 50 * TOKENS_PER_DECISION + 256),
+        )
+
+    def test_default_batch_stays_under_cap(self) -> None:
+        self.assertLess(
+            completion_token_budget(DEFAULT_BATCH_SIZE), MAX_COMPLETION_TOKENS_CAP
+        )
 
 
 class ContextOverflowDetectionTests(unittest.TestCase):
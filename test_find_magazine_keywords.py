@@ -0,0 +1,91 @@
+"""Unit tests for the magazine keyword-only filter."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from test_find_magazine_evaluate import make_candidate, make_searcher
+
+
+class KeywordOnlyFilterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.searcher = make_searcher()
+
+    def test_matches_any_keyword_case_insensitively(self) -> None:
+        candidates = [
+            make_candidate("TIME_Magazine_2025.pdf"),
+            make_candidate("Forbes.pdf", caption="Finance special"),
+            make_candidate("Cooking.pdf"),
+        ]
+        results = self.searcher._keyword_only_filter(candidates, "time finance")
+        self.assertEqual(
+            [c["filename"] for c in results], ["TIME_Magazine_2025.pdf", "Forbes.pdf"]
+        )
+        self.assertEqual(results[0]["ai_decision"]["decision"], "RELEVANT")
+
+    def test_blank_keywords_match_nothing(self) -> None:
+        self.assertEqual(
+            self.searcher._keyword_only_filter([make_candidate("Time.pdf")], "   "), []
+        )
+
+    def test_regex_metacharacters_are_literal(self) -> None:
+        candidates = [make_candidate("C++ Weekly.pdf"), make_candidate("C Weekly.pdf")]
+        results = self.searcher._keyword_only_filter(candidates, "c++")
+        self.assertEqual([c["filename"] for c in results], ["C++ Weekly.pdf"])
+
+
+class FilenameShortCircuitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.searcher = make_searcher(batch_concurrency=4)
+        self.searcher._call_llm_batch = AsyncMock(return_value={})
+
+    def test_all_tokens_in_filename_skips_model(self) -> None:
+        candidates = [make_candidate("National_Geographic_2025-11.pdf")]
+        results = asyncio.run(
+            self.searcher.evaluate_candidates(candidates, "National Geographic")
+        )
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["ai_decision"]["confidence"], 1.0)
+        self.searcher._call_llm_batch.assert_not_called()
+
+    def test_keyword_inside_a_longer_word_goes_to_model(self) -> None:
+        cases = [
+            ("Daily_Mail_2025.pdf", "AI"),
+            ("Smart_Computing_2025.pdf", "art"),
+            ("Oscars_Special.pdf", "cars"),
+            ("Cosmopolitan.pdf", "C++"),
+        ]
+        for filename, keywords in cases:
+            with self.subTest(keywords=keywords):
+                results = asyncio.run(
+                    self.searcher.evaluate_candidates(
+                        [make_candidate(filename)], keywords
+                    )
+                )
+                self.assertEqual(results, [])
+        self.assertEqual(self.searcher._call_llm_batch.await_count, len(cases))
+
+    def test_whole_word_in_filename_skips_model(self) -> None:
+        results = asyncio.run(
+            self.searcher.evaluate_candidates(
+                [make_candidate("Time_Magazine_2025.pdf")], "time"
+            )
+        )
+        self.assertEqual(len(results), 1)
+        self.searcher._call_llm_batch.assert_not_called()
+
+    def test_partial_match_goes_to_model(self) -> None:
+        candidates = [make_candidate("National_Review.pdf")]
+        results = asyncio.run(
+            self.searcher.evaluate_candidates(candidates, "National Geographic")
+        )
+        self.assertEqual(results, [])
+        self.searcher._call_llm_batch.assert_awaited_once()
+        items = self.searcher._call_llm_batch.call_args[0][0]
+        self.assertEqual([i["filename"] for i in items], ["National_Review.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Unit tests for the magazine English-language heuristic."""
+
+from __future__ import annotations
+
+import unittest
+
+from find_magazine import MagazineSearcher
+
+
+class IsLikelyEnglishTests(unittest.TestCase):
+    def test_empty_text_rejected(self) -> None:
+        self.assertFalse(MagazineSearcher._is_likely_english("", ""))
+
+    def test_short_text_passes(self) -> None:
+        self.assertTrue(MagazineSearcher._is_likely_english("été.pdf", ""))
+
+    def test_ascii_filename_accepted(self) -> None:
+        self.assertTrue(
+            MagazineSearcher._is_likely_english("Time_Magazine_2025-11.pdf", "")
+        )
+
+    def test_mostly_non_ascii_rejected(self) -> None:
+        self.assertFalse(
+            MagazineSearcher._is_likely_english("Журнал_Наука_и_жизнь_2025.pdf", "")
+        )
+
+    def test_long_caption_uses_langdetect(self) -> None:
+        caption = (
+            "Der Spiegel ist ein deutsches Nachrichtenmagazin, das jede Woche "
+            "erscheint und über Politik, Wirtschaft, Kultur und Wissenschaft "
+            "berichtet. Diese Ausgabe enthält ausführliche Reportagen und "
+            "Interviews mit bekannten Persönlichkeiten aus aller Welt."
+        )
+        self.assertGreater(len(caption), 200)
+        self.assertFalse(MagazineSearcher._is_likely_english("spiegel.pdf", caption))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Unit tests for magazine search result files."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import find_magazine
+
+
+class SaveOutputsTests(unittest.TestCase):
+    def test_writes_json_without_message_objects(self) -> None:
+        result = {
+            "filename": "Time_2025.pdf",
+            "channel_name": "Mags",
+            "size": 2 * 1024 * 1024,
+            "link": "tg://resolve?domain=mags&post=7",
+            "message": object(),
+            "ai_decision": {
+                "decision": "RELEVANT",
+                "confidence": 0.9,
+                "reasons": ["Keyword match in filename/caption"],
+            },
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(find_magazine, "OUTPUT_DIR", Path(tmp)):
+                find_magazine.save_outputs([result], "time")
+            (json_path,) = Path(tmp).glob("*.json")
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+            (md_path,) = Path(tmp).glob("*.md")
+            self.assertIn("Time_2025.pdf", md_path.read_text())
+        self.assertEqual(data["keywords"], "time")
+        self.assertEqual(data["total_matches"], 1)
+        self.assertNotIn("message", data["results"][0])
+        self.assertEqual(data["results"][0]["ai_decision"]["decision"], "RELEVANT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Unit tests for Telethon session database tuning."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from telegram_session import run_event_loop, tune_session_db
+
+
+class TuneSessionDbTests(unittest.TestCase):
+    def test_enables_wal_and_busy_timeout(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = sqlite3.connect(Path(tmp) / "toi_session.session")
+            try:
+                client = SimpleNamespace(session=SimpleNamespace(_conn=conn))
+                self.assertTrue(tune_session_db(client, busy_timeout_ms=1234))
+                mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+                timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+            finally:
+                conn.close()
+        self.assertEqual(mode, "wal")
+        self.assertEqual(timeout, 1234)
+
+    def test_non_sqlite_session_is_skipped(self) -> None:
+        client = SimpleNamespace(session=SimpleNamespace())
+        self.assertFalse(tune_session_db(client))
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+class RunEventLoopTests(unittest.TestCase):
+    def test_returns_main_result(self) -> None:
+        self.assertEqual(run_event_loop(_answer()), 42)
+
+    def test_falls_back_to_asyncio_without_uvloop(self) -> None:
+        with mock.patch.dict("sys.modules", {"uvloop": None}):
+            with mock.patch("asyncio.run", wraps=asyncio.run) as run:
+                self.assertEqual(run_event_loop(_answer()), 42)
+        run.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Unit tests for GUI output-line parsing patterns."""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import time
+import unittest
+
+from toi_gui import OUTPUT_RE, TS_RE, iter_pipe_lines, parse_output_line
+
+MATCH_LINE = (
+    "2026-04-19 08:00:01,123 - INFO - [MATCH] TOI_Hyd_19-04-2026.pdf | "
+    "Channel: Daily Papers | Size: 12.50 MB | msg_id: 4242 | "
+    "Link: tg://resolve?domain=papers&post=4242"
+)
+
+
+class OutputPatternTests(unittest.TestCase):
+    def test_finds_t_me_and_tg_links(self) -> None:
+        line = "see https://t.me/papers/12 and tg://privatepost?channel=1&post=2 now"
+        self.assertEqual(
+            [m.group("link") for m in OUTPUT_RE.finditer(line)],
+            ["https://t.me/papers/12", "tg://privatepost?channel=1&post=2"],
+        )
+
+    def test_link_stops_at_trailing_punctuation(self) -> None:
+        line = 'links: (tg://resolve?domain=papers&post=7), "https://t.me/p/1".'
+        self.assertEqual(
+            [m.group("link") for m in OUTPUT_RE.finditer(line)],
+            ["tg://resolve?domain=papers&post=7", "https://t.me/p/1"],
+        )
+
+    def test_long_link_run_is_matched_whole(self) -> None:
+        line = "tg://" + "a/-?=&" * 20000 + "!"
+        (m,) = OUTPUT_RE.finditer(line)
+        self.assertEqual(m.group("link"), line[:-1])
+
+    def test_match_record_extracts_fields(self) -> None:
+        (m,) = OUTPUT_RE.finditer(MATCH_LINE)
+        self.assertIsNotNone(m.group("match"))
+        self.assertEqual(m.group("fname"), "TOI_Hyd_19-04-2026.pdf")
+        self.assertEqual(m.group("channel"), "Daily Papers")
+        self.assertEqual(m.group("size"), "12.50 MB")
+        self.assertEqual(m.group("msgid"), "4242")
+        self.assertEqual(m.group("mlink"), "tg://resolve?domain=papers&post=4242")
+
+    def test_match_tag_is_case_sensitive(self) -> None:
+        # Only the record's trailing link is found, as a bare link.
+        (m,) = OUTPUT_RE.finditer(MATCH_LINE.replace("[MATCH]", "[match]"))
+        self.assertIsNone(m.group("match"))
+        self.assertEqual(m.group("link"), "tg://resolve?domain=papers&post=4242")
+
+    def test_ts_re_detects_logged_timestamps(self) -> None:
+        self.assertTrue(TS_RE.match(MATCH_LINE))
+        self.assertFalse(TS_RE.match("Search stopped by user."))
+        self.assertTrue(TS_RE.match("  " + MATCH_LINE))
+
+
+class ParseOutputLineTests(unittest.TestCase):
+    def test_plain_line_is_unstamped_without_links(self) -> None:
+        self.assertEqual(
+            parse_output_line("Search stopped by user.\n"),
+            (False, ["Search stopped by user.\n", ()], []),
+        )
+
+    def test_links_are_tagged_and_reported_in_order(self) -> None:
+        stamped, parts, found = parse_output_line(
+            "see https://t.me/a/1 then tg://resolve?domain=b"
+        )
+        self.assertFalse(stamped)
+        self.assertEqual(
+            parts,
+            [
+                "see ",
+                (),
+                "https://t.me/a/1",
+                "link",
+                " then ",
+                (),
+                "tg://resolve?domain=b",
+                "link",
+                "\n",
+                (),
+            ],
+        )
+        self.assertEqual(
+            found, [("https://t.me/a/1", None), ("tg://resolve?domain=b", None)]
+        )
+
+    def test_match_record_reports_fields(self) -> None:
+        stamped, parts, found = parse_output_line(MATCH_LINE + "\n")
+        self.assertTrue(stamped)
+        self.assertEqual("".join(parts[::2]), MATCH_LINE + "\n")
+        self.assertEqual(
+            found,
+            [
+                (
+                    "tg://resolve?domain=papers&post=4242",
+                    (
+                        "TOI_Hyd_19-04-2026.pdf",
+                        "Daily Papers",
+                        "4242",
+                        "MATCH|4242|Daily Papers",
+                        "tg://resolve?domain=papers&post=4242",
+                    ),
+                )
+            ],
+        )
+
+    def test_match_record_without_link_is_not_tagged(self) -> None:
+        line = MATCH_LINE.replace("tg://resolve?domain=papers&post=4242", "N/A")
+        _, parts, found = parse_output_line(line)
+        self.assertEqual(parts, [line + "\n", ()])
+        self.assertEqual(len(found), 1)
+        link, match = found[0]
+        self.assertIsNone(link)
+        self.assertEqual(match[2:], ("4242", "MATCH|4242|Daily Papers", "N/A"))
+
+    def test_lowercase_match_tag_is_not_a_record(self) -> None:
+        line = MATCH_LINE.replace("[MATCH]", "[match]").replace("tg://", "x://")
+        _, parts, found = parse_output_line(line)
+        self.assertEqual(parts, [line + "\n", ()])
+        self.assertEqual(found, [])
+
+
+class IterPipeLinesTests(unittest.TestCase):
+    def test_joins_lines_split_across_chunks(self) -> None:
+        stream = io.BytesIO("first\r\nsecond línea\nthird".encode("utf-8"))
+        self.assertEqual(
+            list(iter_pipe_lines(stream, chunk_size=4)),
+            ["first", "second línea", "third"],
+        )
+
+    def test_invalid_utf8_is_replaced(self) -> None:
+        stream = io.BytesIO(b"bad \xff byte\n")
+        self.assertEqual(list(iter_pipe_lines(stream)), ["bad \ufffd byte"])
+
+    @unittest.skipIf(sys.platform == "win32", "pipes can't be selected on Windows")
+    def test_should_stop_ends_iteration_on_a_silent_pipe(self) -> None:
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"one\n")
+        calls = []
+
+        def should_stop() -> bool:
+            calls.append(None)
+            return len(calls) >= 2
+
+        with os.fdopen(read_fd, "rb", buffering=0) as stream:
+            started = time.monotonic()
+            lines = list(
+                iter_pipe_lines(stream, should_stop=should_stop, poll_interval=0.01)
+            )
+            elapsed = time.monotonic() - started
+        os.close(write_fd)
+        self.assertEqual(lines, ["one"])
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,66 +1,102 @@
 import unittest
-from datetime import date
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from telethon.tl.types import DocumentAttributeFilename
 
 from find_toi import (
     compile_matchers,
+    extract_filename_from_message,
+    get_file_size,
     is_target_day_post,
+    scan_offset_date,
     should_scan_message_date,
 )
 
 
+def base_match(paper_regex, hyd_regex, filename):
+    return bool(paper_regex.search(filename) and hyd_regex.search(filename))
+
+
 class CompileMatchersTests(unittest.TestCase):
     def test_matches_existing_formats(self):
-        base_regex, date_regex = compile_matchers(["TOI", "TOIH"], "19-04-2026")
+        paper_regex, hyd_regex, date_regex = compile_matchers(
+            ["TOI", "TOIH"], "19-04-2026"
+        )
 
-        self.assertTrue(base_regex.search("TOIH - Hyderabad Times - 19-04-2026.pdf"))
+        self.assertTrue(
+            base_match(
+                paper_regex, hyd_regex, "TOIH - Hyderabad Times - 19-04-2026.pdf"
+            )
+        )
         self.assertTrue(date_regex.search("TOIH - Hyderabad Times - 19-04-2026.pdf"))
-        self.assertTrue(base_regex.search("ToI Hyderabad Times 19.04.2026.pdf"))
+        self.assertTrue(
+            base_match(paper_regex, hyd_regex, "ToI Hyderabad Times 19.04.2026.pdf")
+        )
         self.assertTrue(date_regex.search("ToI Hyderabad Times 19.04.2026.pdf"))
-        self.assertTrue(base_regex.search("TOI_Hyderabad_19-04-2026.pdf"))
+        self.assertTrue(
+            base_match(paper_regex, hyd_regex, "TOI_Hyderabad_19-04-2026.pdf")
+        )
         self.assertTrue(date_regex.search("TOI_Hyderabad_19-04-2026.pdf"))
 
     def test_matches_new_apostrophe_date_format(self):
-        base_regex, date_regex = compile_matchers(["TOI", "TOIH"], "19-04-2026")
+        paper_regex, hyd_regex, date_regex = compile_matchers(
+            ["TOI", "TOIH"], "19-04-2026"
+        )
 
-        self.assertTrue(base_regex.search("ToI Hyderabad 19'04'2026.pdf"))
+        self.assertTrue(
+            base_match(paper_regex, hyd_regex, "ToI Hyderabad 19'04'2026.pdf")
+        )
         self.assertTrue(date_regex.search("ToI Hyderabad 19'04'2026.pdf"))
 
     def test_rejects_non_hyderabad_files(self):
-        base_regex, date_regex = compile_matchers(["TOI", "TOIH"], "19-04-2026")
+        paper_regex, hyd_regex, date_regex = compile_matchers(
+            ["TOI", "TOIH"], "19-04-2026"
+        )
 
-        self.assertFalse(base_regex.search("ToI Chennai 19'04'2026.pdf"))
+        self.assertFalse(
+            base_match(paper_regex, hyd_regex, "ToI Chennai 19'04'2026.pdf")
+        )
         self.assertTrue(date_regex.search("ToI Chennai 19'04'2026.pdf"))
 
     def test_matches_deccan_chronicle_formats(self):
-        base_regex, date_regex = compile_matchers(
+        paper_regex, hyd_regex, date_regex = compile_matchers(
             ["DC", "Deccan Chronicle"], "19-04-2026", newspaper="dc"
         )
 
-        self.assertTrue(base_regex.search("DC_Hyderabad_19-04-2026.pdf"))
-        self.assertTrue(date_regex.search("DC_Hyderabad_19-04-2026.pdf"))
         self.assertTrue(
-            base_regex.search("Deccan Chronicle Hyderabad 19.04.2026.pdf")
+            base_match(paper_regex, hyd_regex, "DC_Hyderabad_19-04-2026.pdf")
         )
+        self.assertTrue(date_regex.search("DC_Hyderabad_19-04-2026.pdf"))
         self.assertTrue(
-            date_regex.search("Deccan Chronicle Hyderabad 19.04.2026.pdf")
+            base_match(
+                paper_regex, hyd_regex, "Deccan Chronicle Hyderabad 19.04.2026.pdf"
+            )
         )
+        self.assertTrue(date_regex.search("Deccan Chronicle Hyderabad 19.04.2026.pdf"))
 
     def test_deccan_chronicle_rejects_unrelated_dc_substrings(self):
-        base_regex, _ = compile_matchers(
+        paper_regex, hyd_regex, _ = compile_matchers(
             ["DC", "Deccan Chronicle"], "19-04-2026", newspaper="dc"
         )
 
-        self.assertFalse(base_regex.search("IndianChronicle Hyderabad 19-04-2026.pdf"))
-        self.assertFalse(base_regex.search("ABCD Hyderabad 19-04-2026.pdf"))
+        self.assertFalse(
+            base_match(
+                paper_regex, hyd_regex, "IndianChronicle Hyderabad 19-04-2026.pdf"
+            )
+        )
+        self.assertFalse(
+            base_match(paper_regex, hyd_regex, "ABCD Hyderabad 19-04-2026.pdf")
+        )
 
     def test_deccan_chronicle_previous_day_filename_posted_today(self):
         target_date = date(2026, 5, 16)
-        base_regex, date_regex = compile_matchers(
+        paper_regex, hyd_regex, date_regex = compile_matchers(
             ["DC", "Deccan Chronicle"], "16-05-2026", newspaper="dc"
         )
         filename = "DC_Hyderabad_15-05-2026.pdf"
 
-        self.assertTrue(base_regex.search(filename))
+        self.assertTrue(base_match(paper_regex, hyd_regex, filename))
         self.assertFalse(date_regex.search(filename))
         self.assertTrue(is_target_day_post(date(2026, 5, 16), target_date))
 
@@ -76,14 +112,44 @@ class CompileMatchersTests(unittest.TestCase):
 
     def test_target_day_post_is_an_additional_match_path(self):
         target_date = date(2026, 4, 19)
-        base_regex, date_regex = compile_matchers(["TOI", "TOIH"], "19-04-2026")
+        paper_regex, hyd_regex, date_regex = compile_matchers(
+            ["TOI", "TOIH"], "19-04-2026"
+        )
         filename = "ToI Hyderabad.pdf"
 
-        self.assertTrue(base_regex.search(filename))
+        self.assertTrue(base_match(paper_regex, hyd_regex, filename))
         self.assertFalse(date_regex.search(filename))
         self.assertTrue(is_target_day_post(date(2026, 4, 19), target_date))
         self.assertFalse(is_target_day_post(date(2026, 4, 18), target_date))
 
 
+class ScanOffsetDateTests(unittest.TestCase):
+    def test_offset_is_start_of_day_after_window(self):
+        offset = scan_offset_date(date(2026, 4, 19))
+
+        self.assertEqual(offset, datetime(2026, 4, 21, tzinfo=timezone.utc))
+        self.assertFalse(should_scan_message_date(offset.date(), date(2026, 4, 19)))
+
+    def test_no_offset_without_target_date(self):
+        self.assertIsNone(scan_offset_date(None))
+
+
+class MessageDocumentTests(unittest.TestCase):
+    def test_reads_filename_and_size_from_document(self):
+        doc = SimpleNamespace(
+            attributes=[DocumentAttributeFilename(file_name="TOI_Hyd.pdf")],
+            size=2048,
+        )
+        msg = SimpleNamespace(document=doc)
+
+        self.assertEqual(extract_filename_from_message(msg), "TOI_Hyd.pdf")
+        self.assertEqual(get_file_size(msg), 2048)
+
+    def test_messages_without_document(self):
+        for msg in (SimpleNamespace(document=None), SimpleNamespace()):
+            self.assertIsNone(extract_filename_from_message(msg))
+            self.assertEqual(get_file_size(msg), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
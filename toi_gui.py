@@ -3,14 +3,15 @@ TOI Telegram Link Finder - Modern Windows GUI
 Redesigned with customtkinter for a premium look and feel.
 """
 
+import collections
 import os
 import re
+import selectors
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
-import webbrowser
-from datetime import datetime
 from pathlib import Path
 from tkinter import scrolledtext
 
@@ -20,6 +21,32 @@ import customtkinter as ctk
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+# Output-line patterns, compiled once instead of on every streamed line.
+# Non-overlapping character classes keep matching linear on long URLs.
+LINK_PATTERN = r"https?://t\.me/[\w/\-]+|tg://[\w/\-?=&]+"
+MATCH_PATTERN = (
+    r"\[MATCH\]\s*(?P<fname>.*?)\s*\|\s*Channel:\s*(?P<channel>.*?)"
+    r"(?:\s*\|\s*Size:\s*(?P<size>[\d\.]+\s*MB))?\s*\|\s*msg_id:\s*(?P<msgid>\d+)"
+    r"\s*\|\s*Link:\s*(?P<mlink>\S+)"
+)
+# One alternation so each line is scanned once: a [MATCH] record (whose
+# trailing link is the "mlink" group) or a bare Telegram link.
+OUTPUT_RE = re.compile(rf"(?P<match>{MATCH_PATTERN})|(?P<link>{LINK_PATTERN})")
+# A [MATCH] record's link is only clickable when it is a real Telegram link
+# (find_toi writes "N/A" when it has none).
+LINK_RE = re.compile(LINK_PATTERN)
+# Leading whitespace is allowed so lines can be tested without strip().
+TS_RE = re.compile(r"\s*\d{4}[-/]")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Prefix for lines that arrive without a timestamp, produced by one strftime.
+TIMESTAMP_PREFIX_FORMAT = TIMESTAMP_FORMAT + " - "
+# Output is rendered in batches at most this often (~30 redraws/sec).
+FLUSH_INTERVAL_MS = 33
+# Older console lines are dropped beyond this many.
+MAX_OUTPUT_LINES = 5000
+# Subprocess output is read from the pipe in chunks of this many bytes.
+READ_CHUNK_SIZE = 65536
+
 
 def terminate_process_tree(process: subprocess.Popen | None, timeout: float = 5.0) -> None:
     """Force-stop a subprocess and any children (e.g. `uv run` → python).
@@ -55,6 +82,94 @@ def terminate_process_tree(process: subprocess.Popen | None, timeout: float = 5.
         pass
 
 
+def iter_pipe_lines(
+    stream, chunk_size: int = READ_CHUNK_SIZE, should_stop=None, poll_interval=0.1
+):
+    """Yield decoded lines from a binary pipe, reading it in large chunks.
+
+    Unlike text-mode line iteration, this costs one read per chunk rather than
+    per line. A trailing partial line is carried over to the next chunk and
+    yielded at EOF.
+
+    If ``should_stop`` is given, the pipe is polled with a selector every
+    ``poll_interval`` seconds and iteration ends as soon as it returns True,
+    even while the child is silent (or a grandchild still holds the pipe
+    open). Windows pipes can't be selected on, so there reads stay blocking.
+    """
+    sel = None
+    if should_stop is not None and sys.platform != "win32":
+        sel = selectors.DefaultSelector()
+        sel.register(stream, selectors.EVENT_READ)
+    buf = b""
+    try:
+        while True:
+            if sel is not None:
+                while not sel.select(timeout=poll_interval):
+                    if should_stop():
+                        return
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                yield line.rstrip(b"\r").decode("utf-8", "replace")
+        if buf:
+            yield buf.rstrip(b"\r").decode("utf-8", "replace")
+    finally:
+        if sel is not None:
+            sel.close()
+
+
+def parse_output_line(text: str):
+    """Split one output line into Text.insert arguments and discovered links.
+
+    Returns ``(stamped, parts, found)``: whether the line already starts with
+    a timestamp, alternating (text, tags) insert arguments with links tagged
+    "link", and one ``(link, match)`` pair per link or [MATCH] record in order
+    of appearance. ``match`` is ``(fname, channel, msgid, display_key, mlink)``
+    for [MATCH] records and None for bare links; ``link`` is None when a
+    record's mlink is not a Telegram link.
+    """
+    stamped = TS_RE.match(text) is not None
+    line = text.rstrip("\n") if stamped else text.rstrip()
+
+    # Most lines have neither a link nor a [MATCH] record (both scanners log
+    # the tag upper-case, and OUTPUT_RE matches it case-sensitively); plain
+    # substring checks are far cheaper than the regex.
+    if "t.me/" not in line and "tg://" not in line and "[MATCH]" not in line:
+        return stamped, [line + "\n", ()], []
+
+    # Single scan: detect links / [MATCH] records, collecting (text, tags)
+    # pairs so the whole line goes to Tk in one tagged insert.
+    pos = 0
+    parts = []
+    found = []
+    for m in OUTPUT_RE.finditer(line):
+        match = None
+        if m.group("match") is None:
+            link = m.group("link")
+            link_start, link_end = m.span("link")
+        else:
+            fname = m.group("fname").strip()
+            channel = m.group("channel").strip()
+            msgid = m.group("msgid").strip()
+            mlink = m.group("mlink")
+            match = (fname, channel, msgid, f"MATCH|{msgid}|{channel}", mlink)
+            link_start = m.start("mlink")
+            link_m = LINK_RE.match(mlink)
+            link = link_m.group() if link_m else None
+            link_end = link_start + len(link) if link else link_start
+        found.append((link, match))
+
+        if link:
+            parts += (line[pos:link_start], (), link, "link")
+            pos = link_end
+
+    parts += (line[pos:] + "\n", ())
+    return stamped, parts, found
+
+
 class TOIFinderGUI:
     def __init__(self, root):
         self.root = root
@@ -148,14 +263,37 @@ class TOIFinderGUI:
         )
         self.clear_btn.grid(row=0, column=1, sticky="e")
 
-        # Discovered Links Frame (Scrollable)
-        self.links_frame = ctk.CTkScrollableFrame(
-            self.main_frame,
-            label_text="📎 Discovered Telegram Links",
-            label_font=ctk.CTkFont(weight="bold"),
-        )
+        # Discovered Links Frame: one Listbox row per link/match instead of a
+        # widget each, so thousands of results stay cheap to add and scroll.
+        self.links_frame = ctk.CTkFrame(self.main_frame)
         self.links_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         self.links_frame.grid_columnconfigure(0, weight=1)
+        self.links_frame.grid_rowconfigure(1, weight=1)
+        self.links_label = ctk.CTkLabel(
+            self.links_frame,
+            text="📎 Discovered Telegram Links",
+            font=ctk.CTkFont(weight="bold"),
+        )
+        self.links_label.grid(row=0, column=0, columnspan=2, pady=(5, 0))
+        self.links_list = tk.Listbox(
+            self.links_frame,
+            height=8,
+            bg="#2b2b2b",
+            fg="#d4d4d4",
+            selectbackground="#3d3d3d",
+            activestyle="none",
+            font=("Consolas", 10),
+            borderwidth=0,
+            highlightthickness=0,
+            cursor="hand2",
+        )
+        self.links_list.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=10)
+        links_scrollbar = tk.Scrollbar(
+            self.links_frame, orient="vertical", command=self.links_list.yview
+        )
+        links_scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 10), pady=10)
+        self.links_list.configure(yscrollcommand=links_scrollbar.set)
+        self.links_list.bind("<ButtonRelease-1>", self.on_links_list_click)
         self.links_frame.grid_remove()  # Hide initially
 
         # Console Output
@@ -193,11 +331,20 @@ class TOIFinderGUI:
         )
 
         # Internal state
-        self.discovered_links = []
-        self.links = {}
-        self.link_counter = 0
+        # Discovered URLs / match display keys, for O(1) dedup.
+        self._link_set = set()
+        self._match_keys = set()
+        # Click handler per links_list row, by row index.
+        self._link_actions = []
+        # links_frame starts hidden; grid it once on the first discovery.
+        self._links_frame_shown = False
         self.stop_search_flag = False
         self.process = None
+        self._pending = collections.deque()
+        self._flush_scheduled = False
+        # Cached _timestamp_prefix() string and the epoch second it was made for.
+        self._ts_sec = None
+        self._ts_str = ""
         self._search_generation = 0
         self._search_lock = threading.Lock()
 
@@ -205,105 +352,106 @@ class TOIFinderGUI:
         ctk.set_appearance_mode(new_appearance_mode)
 
     def append_output(self, text):
-        """Append text to output area and detect links. Add timestamp if missing."""
+        """Queue text for the output area; safe to call from the reader thread.
+
+        Lines are parsed here, on the caller's thread, and rendered by
+        _flush_output at most every FLUSH_INTERVAL_MS, so a chatty subprocess
+        costs one Tk callback per tick and no regex work on the Tk thread.
+        """
         if not text:
             return
-
-        # Add timestamp unless line already looks like it has one
-        if re.match(r"^\d{4}[-/]", text.strip()):
-            line = text.rstrip("\n")
-        else:
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            line = f"{ts} - {text.rstrip()}"
-
-        link_pattern = r"(https?://t\.me/[\w\-_/]+|tg://[^\s]+)"
-
-        # Detect any links
-        links_found = re.findall(link_pattern, line)
-        if links_found:
-            self.root.after(0, self.links_frame.grid)
-            for link in links_found:
-                clean = link.rstrip('.,)"')
-                self.root.after(0, self.add_discovered_link, clean)
-
-        # Detect [MATCH] lines
-        match_pattern = re.compile(
-            r"\[MATCH\]\s*(?P<fname>.*?)\s*\|\s*Channel:\s*(?P<channel>.*?)(?:\s*\|\s*Size:\s*(?P<size>[\d\.]+\s*MB))?\s*\|\s*msg_id:\s*(?P<msgid>\d+)\s*\|\s*Link:\s*(?P<link>\S+)",
-            re.IGNORECASE,
-        )
-        m = match_pattern.search(line)
-        if m:
-            fname = m.group("fname").strip()
-            channel = m.group("channel").strip()
-            msgid = m.group("msgid").strip()
-            link = m.group("link").strip()
-            display_key = f"MATCH|{msgid}|{channel}"
-            self.root.after(0, self.links_frame.grid)
-            if display_key not in [
-                entry[0] for entry in self.discovered_links if isinstance(entry, tuple)
-            ]:
-                self.root.after(
-                    0, self.add_match_entry, fname, channel, msgid, display_key, link
-                )
-
-        # Insert into text area
-        parts = re.split(link_pattern, line)
-        for part in parts:
-            if re.match(link_pattern, part):
-                link_id = f"link_{self.link_counter}"
-                self.link_counter += 1
-                self.links[link_id] = part
-                start_idx = self.output_text.index(tk.INSERT)
-                self.output_text.insert(tk.INSERT, part)
-                end_idx = self.output_text.index(tk.INSERT)
-                self.output_text.tag_add("link", start_idx, end_idx)
-                self.output_text.tag_add(link_id, start_idx, end_idx)
-            else:
-                self.output_text.insert(tk.INSERT, part)
-
-        self.output_text.insert(tk.INSERT, "\n")
-        self.output_text.see(tk.END)
+        self._pending.append(parse_output_line(text))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(FLUSH_INTERVAL_MS, self._flush_output)
+
+    def _flush_output(self):
+        # Clear the flag before draining so a line queued mid-flush schedules
+        # another tick rather than being stranded.
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        # Only follow new output if the view was already at the bottom, so
+        # scrolling back through the log isn't yanked away every tick.
+        follow = self.output_text.yview()[1] > 0.98
+        prefix = self._timestamp_prefix()
+        # Drain only what was queued when the flush started; lines the reader
+        # adds meanwhile have scheduled the next tick, so a fast producer can't
+        # keep the Tk thread here forever.
+        for _ in range(len(self._pending)):
+            self._render_line(self._pending.popleft(), prefix)
+        self._trim_output()
+        if follow:
+            self.output_text.see(tk.END)
+
+    def _trim_output(self):
+        """Keep the console at MAX_OUTPUT_LINES; Tk's Text slows as it grows."""
+        line_count = int(self.output_text.index("end-1c").split(".")[0])
+        if line_count <= MAX_OUTPUT_LINES:
+            return
+        self.output_text.delete("1.0", f"{line_count - MAX_OUTPUT_LINES + 1}.0")
+
+    def _timestamp_prefix(self):
+        """Current TIMESTAMP_PREFIX_FORMAT string, formatted at most once per second."""
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime(TIMESTAMP_PREFIX_FORMAT, time.localtime(sec))
+        return self._ts_str
+
+    def _render_line(self, parsed, prefix):
+        """Insert one parse_output_line() result into the output area. Add timestamp prefix if missing."""
+        stamped, parts, found = parsed
+        if not stamped:
+            parts = [prefix, (), *parts]
+        self.output_text.insert(tk.END, *parts)
+
+        # Already on the Tk thread (via _flush_output), so update the links
+        # list directly rather than queueing an after() event per link.
+        for link, match in found:
+            if not self._links_frame_shown:
+                self._links_frame_shown = True
+                self.links_frame.grid()
+            if link:
+                self.add_discovered_link(link.rstrip('.,)"'))
+            if match is not None:
+                self.add_match_entry(*match)
 
     def add_discovered_link(self, link: str):
-        if link in self.discovered_links:
+        if link in self._link_set:
             return
-        self.discovered_links.append(link)
-
-        btn = ctk.CTkButton(
-            self.links_frame,
-            text=link,
-            anchor="w",
-            fg_color="transparent",
-            text_color="#3794ff",
-            hover_color="#2b2b2b",
-            command=lambda lnk=link: self.open_discovered_link(lnk),
+        self._link_set.add(link)
+        self._add_links_row(
+            link, "#3794ff", lambda lnk=link: self.open_discovered_link(lnk)
         )
-        btn.grid(row=len(self.discovered_links), column=0, sticky="ew", pady=2)
 
     def add_match_entry(
         self, fname: str, channel: str, msgid: str, key: str, link: str = ""
     ):
         # Check if already added
-        if any(
-            isinstance(entry, tuple) and entry[0] == key
-            for entry in self.discovered_links
-        ):
+        if key in self._match_keys:
             return
-        self.discovered_links.append((key, fname))
-
-        label_text = f"📄 {fname}\n📡 {channel} | ID: {msgid}"
-        btn = ctk.CTkButton(
-            self.links_frame,
-            text=label_text,
-            anchor="w",
-            fg_color="#2d2d2d",
-            hover_color="#3d3d3d",
-            text_color="#d4d4d4",
-            command=lambda ch=channel, mid=msgid, lnk=link: self.on_match_click(
-                ch, mid, lnk
-            ),
+        self._match_keys.add(key)
+        label_text = f"📄 {fname}  📡 {channel} | ID: {msgid}"
+        self._add_links_row(
+            label_text,
+            "#d4d4d4",
+            lambda ch=channel, mid=msgid, lnk=link: self.on_match_click(ch, mid, lnk),
         )
-        btn.grid(row=len(self.discovered_links), column=0, sticky="ew", pady=5, padx=5)
+
+    def _add_links_row(self, text: str, color: str, action):
+        self.links_list.insert(tk.END, text)
+        self.links_list.itemconfig(tk.END, foreground=color)
+        self._link_actions.append(action)
+
+    def on_links_list_click(self, event):
+        if not self._link_actions:
+            return
+        row = self.links_list.nearest(event.y)
+        bbox = self.links_list.bbox(row)
+        # nearest() snaps clicks in the empty area below to the last row.
+        if bbox and event.y <= bbox[1] + bbox[3] and row < len(self._link_actions):
+            self._link_actions[row]()
 
     def open_discovered_link(self, link: str):
         try:
@@ -328,17 +476,16 @@ class TOIFinderGUI:
         self.status_label.configure(text=status_text)
 
     def open_link(self, event):
-        index = self.output_text.index(f"@{event.x},{event.y}")
-        tags = self.output_text.tag_names(index)
-        for tag in tags:
-            if tag.startswith("link_"):
-                link = self.links.get(tag)
-                if link:
-                    try:
-                        self._open_telegram_link(link)
-                    except Exception as e:
-                        self.append_output(f"✗ Failed to open link: {e}")
-                break
+        # The click landed on a "link" range; the nearest range starting at or
+        # before the next character is the one under the pointer.
+        link_range = self.output_text.tag_prevrange("link", f"@{event.x},{event.y}+1c")
+        if not link_range:
+            return
+        link = self.output_text.get(*link_range)
+        try:
+            self._open_telegram_link(link)
+        except Exception as e:
+            self.append_output(f"✗ Failed to open link: {e}")
 
     @staticmethod
     def _open_telegram_link(link: str) -> None:
@@ -346,17 +493,18 @@ class TOIFinderGUI:
         if sys.platform == "win32":
             os.startfile(link)  # type: ignore[attr-defined]
         else:
+            import webbrowser  # Deferred: only needed once a link is clicked.
+
             webbrowser.open(link)
 
     def clear_output(self):
         self.output_text.delete(1.0, tk.END)
-        self.links.clear()
-        self.link_counter = 0
-        for child in self.links_frame.winfo_children():
-            if not isinstance(child, ctk.CTkLabel):  # Keep the header label if any
-                child.destroy()
-        self.discovered_links.clear()
+        self.links_list.delete(0, tk.END)
+        self._link_actions.clear()
+        self._link_set.clear()
+        self._match_keys.clear()
         self.links_frame.grid_remove()
+        self._links_frame_shown = False
         self.status_label.configure(text="Ready to search")
         self.stop_btn.configure(state="disabled")
         # Do not clear self.process here — an active search may still own it.
@@ -409,9 +557,7 @@ class TOIFinderGUI:
             popen_kwargs = {
                 "stdout": subprocess.PIPE,
                 "stderr": subprocess.STDOUT,
-                "encoding": "utf-8",
-                "errors": "replace",
-                "bufsize": 1,
+                "bufsize": 0,
                 "cwd": script_path.parent,
             }
             if sys.platform == "win32":
@@ -427,15 +573,19 @@ class TOIFinderGUI:
 
             self.root.after(0, lambda: self.stop_btn.configure(state="normal"))
 
+            def stopped() -> bool:
+                return self.stop_search_flag or generation != self._search_generation
+
             assert process.stdout is not None
-            for line in process.stdout:
-                if self.stop_search_flag or generation != self._search_generation:
-                    terminate_process_tree(process)
-                    self.root.after(0, self.append_output, "Search stopped by user.")
+            for line in iter_pipe_lines(process.stdout, should_stop=stopped):
+                if stopped():
                     break
-                self.root.after(0, self.append_output, line)
+                self.append_output(line)
 
-            if not self.stop_search_flag and generation == self._search_generation:
+            if stopped():
+                terminate_process_tree(process)
+                self.root.after(0, self.append_output, "Search stopped by user.")
+            else:
                 exit_code = process.wait()
                 if exit_code == 0:
                     self.root.after(